@@ -36,22 +36,19 @@ def load_yaml(p: Path) -> Dict[str, Any]:
     return data
 
 
-def get_str(d: Dict[str, Any], path: str) -> str:
-    cur: Any = d
-    for k in path.split("."):
-        if not isinstance(cur, dict) or k not in cur:
-            return ""
-        cur = cur[k]
-    return cur if isinstance(cur, str) else ""
+def get_str(d: Dict[str, Any], key: str) -> str:
+    v = d.get(key)
+    return v if isinstance(v, str) else ""
 
 
-def get_list(d: Dict[str, Any], path: str) -> List[Any]:
-    cur: Any = d
-    for k in path.split("."):
-        if not isinstance(cur, dict) or k not in cur:
-            return []
-        cur = cur[k]
-    return cur if isinstance(cur, list) else []
+def get_list(d: Dict[str, Any], key: str) -> List[Any]:
+    v = d.get(key)
+    return v if isinstance(v, list) else []
+
+
+def get_dict(d: Dict[str, Any], key: str) -> Dict[str, Any]:
+    v = d.get(key)
+    return v if isinstance(v, dict) else {}
 
 
 def has_placeholders(obj: Any) -> bool:
@@ -69,9 +66,11 @@ def validate_one(p: Path) -> List[str]:
     errs: List[str] = []
 
     # Backwards-compatible: v1.0 has these keys; v1.1 adds more, but we keep required minimal.
-    name = get_str(d, "project.name")
-    summary = get_str(d, "project.summary")
-    role = get_str(d, "project.role")
+    # Resolve each section once, then read its fields with single-key lookups.
+    project = get_dict(d, "project")
+    name = get_str(project, "name")
+    summary = get_str(project, "summary")
+    role = get_str(project, "role")
 
     if not name.strip():
         errs.append("missing project.name")
@@ -80,8 +79,9 @@ def validate_one(p: Path) -> List[str]:
     if not role.strip():
         errs.append("missing project.role")
 
-    do = get_list(d, "ai_guidance.do")
-    dont = get_list(d, "ai_guidance.dont")
+    guidance = get_dict(d, "ai_guidance")
+    do = get_list(guidance, "do")
+    dont = get_list(guidance, "dont")
     if len(do) == 0:
         errs.append("ai_guidance.do must not be empty")
     if len(dont) == 0:
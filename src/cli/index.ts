@@ -17,6 +17,14 @@ import { defaultLogger } from '../core/logger';
 
 const program = new Command();
 
+// Severity icons for the insights listing
+const SEVERITY_ICONS: Record<RiskSeverity, string> = {
+  [RiskSeverity.Low]: '📘',
+  [RiskSeverity.Medium]: '📙',
+  [RiskSeverity.High]: '📕',
+  [RiskSeverity.Critical]: '🔥',
+};
+
 // Global Heimgeist instance for CLI commands
 let heimgeist: Heimgeist;
 
@@ -231,12 +239,7 @@ program
     console.log(`\n=== Insights (${insights.length}) ===\n`);
 
     insights.forEach((insight) => {
-      const icon = {
-        [RiskSeverity.Low]: '📘',
-        [RiskSeverity.Medium]: '📙',
-        [RiskSeverity.High]: '📕',
-        [RiskSeverity.Critical]: '🔥',
-      }[insight.severity];
+      const icon = SEVERITY_ICONS[insight.severity];
 
       console.log(`${icon} [${insight.severity.toUpperCase()}] ${insight.title}`);
       console.log(`   Role: ${insight.role} | Type: ${insight.type}`);
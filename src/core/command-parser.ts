@@ -14,6 +14,30 @@ export class CommandParser {
   // Matches @heimgewebe/<tool> OR @self (alias)
   private static readonly MENTION_PATTERN = /@(?:heimgewebe\/(\w+)|(self))\s+\/(\S+)(?:\s+([^\n@]*))?/g;
 
+  // Command tables, built once instead of on every validation call
+  private static readonly VALID_TOOLS: ReadonlySet<string> = new Set([
+    'sichter',
+    'wgx',
+    'heimlern',
+    'metarepo',
+    'heimgeist',
+    'self',
+  ]);
+  private static readonly AUTONOMY_LEVELS: ReadonlySet<string> = new Set([
+    'dormant',
+    'aware',
+    'reflective',
+    'critical',
+  ]);
+  private static readonly SELF_COMMANDS = ['status', 'reflect', 'reset', 'set'];
+  private static readonly SICHTER_COMMANDS = ['quick', 'deep', 'full', 'compare'];
+  private static readonly WGX_COMMANDS = ['guard', 'smoke'];
+  private static readonly WGX_GUARD_SCOPES = ['all', 'changed', 'affected'];
+  private static readonly WGX_SMOKE_ENVS = ['staging', 'production'];
+  private static readonly HEIMLERN_COMMANDS = ['pattern-good', 'pattern-bad', 'similar'];
+  private static readonly METAREPO_COMMANDS = ['link-epic', 'visualize'];
+  private static readonly HEIMGEIST_COMMANDS = ['analyse', 'explain', 'risk'];
+
   /**
    * Parse commands from a comment text
    */
@@ -121,7 +145,7 @@ export class CommandParser {
   private static isValidTool(tool: string): tool is HeimgewebeCommand['tool'] {
     // Note: 'self' is treated as a shorthand for 'heimgeist' context-aware commands
     // Supported: @heimgewebe/self OR @self
-    return ['sichter', 'wgx', 'heimlern', 'metarepo', 'heimgeist', 'self'].includes(tool);
+    return this.VALID_TOOLS.has(tool);
   }
 
   /**
@@ -164,7 +188,7 @@ export class CommandParser {
     valid: boolean;
     error?: string;
   } {
-    const validCommands = ['status', 'reflect', 'reset', 'set'];
+    const validCommands = this.SELF_COMMANDS;
 
     if (!validCommands.includes(command.command)) {
       return {
@@ -183,7 +207,7 @@ export class CommandParser {
         const autonomyArg = command.args.find(a => a.startsWith('autonomy='));
         if (autonomyArg) {
             const level = autonomyArg.split('=')[1];
-            if (!['dormant', 'aware', 'reflective', 'critical'].includes(level)) {
+            if (!this.AUTONOMY_LEVELS.has(level)) {
                 return { valid: false, error: `Invalid autonomy level: ${level}` };
             }
         }
@@ -217,7 +241,7 @@ export class CommandParser {
     valid: boolean;
     error?: string;
   } {
-    const validCommands = ['quick', 'deep', 'full', 'compare'];
+    const validCommands = this.SICHTER_COMMANDS;
 
     if (!validCommands.includes(command.command)) {
       return {
@@ -243,7 +267,7 @@ export class CommandParser {
     valid: boolean;
     error?: string;
   } {
-    const validCommands = ['guard', 'smoke'];
+    const validCommands = this.WGX_COMMANDS;
 
     if (!validCommands.includes(command.command)) {
       return {
@@ -253,7 +277,7 @@ export class CommandParser {
     }
 
     if (command.command === 'guard') {
-      const validScopes = ['all', 'changed', 'affected'];
+      const validScopes = this.WGX_GUARD_SCOPES;
       if (command.args.length > 0 && !validScopes.includes(command.args[0])) {
         return {
           valid: false,
@@ -263,7 +287,7 @@ export class CommandParser {
     }
 
     if (command.command === 'smoke') {
-      const validEnvs = ['staging', 'production'];
+      const validEnvs = this.WGX_SMOKE_ENVS;
       if (command.args.length > 0 && !validEnvs.includes(command.args[0])) {
         return {
           valid: false,
@@ -282,7 +306,7 @@ export class CommandParser {
     valid: boolean;
     error?: string;
   } {
-    const validCommands = ['pattern-good', 'pattern-bad', 'similar'];
+    const validCommands = this.HEIMLERN_COMMANDS;
 
     if (!validCommands.includes(command.command)) {
       return {
@@ -311,7 +335,7 @@ export class CommandParser {
     valid: boolean;
     error?: string;
   } {
-    const validCommands = ['link-epic', 'visualize'];
+    const validCommands = this.METAREPO_COMMANDS;
 
     if (!validCommands.includes(command.command)) {
       return {
@@ -337,7 +361,7 @@ export class CommandParser {
     valid: boolean;
     error?: string;
   } {
-    const validCommands = ['analyse', 'explain', 'risk'];
+    const validCommands = this.HEIMGEIST_COMMANDS;
 
     if (!validCommands.includes(command.command)) {
       return {
@@ -51,6 +51,28 @@ const INSIGHT_CODE = {
   DEPLOY_FAILED: 'deploy_failed',
 } as const;
 
+/**
+ * Key fragments whose values are redacted by sanitizePayload.
+ * Refined list to avoid false positives (e.g. 'key' -> 'keyboard').
+ * Compiled into a single alternation so each key is lowercased and matched once.
+ */
+const SENSITIVE_KEY_PATTERN = new RegExp(
+  [
+    'token',
+    'secret',
+    'password',
+    'apikey',
+    'auth_code',
+    'api_key',
+    'credential',
+    'bearer',
+    'cookie',
+    'session',
+    'private_key',
+    'ssh_key',
+  ].join('|')
+);
+
 /**
  * Heimgeist - The System Self-Reflection Engine
  *
@@ -1343,8 +1365,16 @@ export class Heimgeist {
    * Generate a summary in Heimgeist's characteristic style
    */
   private generateSummary(insights: Insight[], actions: PlannedAction[]): string {
-    const criticalCount = insights.filter((i) => i.severity === RiskSeverity.Critical).length;
-    const highCount = insights.filter((i) => i.severity === RiskSeverity.High).length;
+    // Single pass over insights instead of one filter() per severity
+    let criticalCount = 0;
+    let highCount = 0;
+    for (const insight of insights) {
+      if (insight.severity === RiskSeverity.Critical) {
+        criticalCount++;
+      } else if (insight.severity === RiskSeverity.High) {
+        highCount++;
+      }
+    }
 
     if (criticalCount > 0) {
       return `Well, this is concerning. ${criticalCount} critical issues demand immediate attention. The system is not as stable as you might think.`;
@@ -1424,15 +1454,19 @@ export class Heimgeist {
    * Get risk assessment for the system
    */
   getRiskAssessment(): RiskAssessment {
-    const criticalInsights = Array.from(this.insights.values()).filter(
-      (i) => i.severity === RiskSeverity.Critical
-    );
-    const highInsights = Array.from(this.insights.values()).filter(
-      (i) => i.severity === RiskSeverity.High
-    );
-    const mediumInsights = Array.from(this.insights.values()).filter(
-      (i) => i.severity === RiskSeverity.Medium
-    );
+    // Bucket insights by severity in one pass over the map
+    const criticalInsights: Insight[] = [];
+    const highInsights: Insight[] = [];
+    const mediumInsights: Insight[] = [];
+    for (const insight of this.insights.values()) {
+      if (insight.severity === RiskSeverity.Critical) {
+        criticalInsights.push(insight);
+      } else if (insight.severity === RiskSeverity.High) {
+        highInsights.push(insight);
+      } else if (insight.severity === RiskSeverity.Medium) {
+        mediumInsights.push(insight);
+      }
+    }
     const pendingActions = Array.from(this.plannedActions.values()).filter(
       (a) => a.status === 'pending'
     );
@@ -1877,24 +1911,8 @@ export class Heimgeist {
 
       if (typeof obj === 'object') {
         const result: Record<string, unknown> = {};
-        // Refined sensitive keys list to avoid false positives (e.g. 'key' -> 'keyboard')
-        const sensitiveKeys = [
-          'token',
-          'secret',
-          'password',
-          'apikey',
-          'auth_code',
-          'api_key',
-          'credential',
-          'bearer',
-          'cookie',
-          'session',
-          'private_key',
-          'ssh_key',
-        ];
-
         for (const [key, value] of Object.entries(obj as Record<string, unknown>)) {
-          if (sensitiveKeys.some((s) => key.toLowerCase().includes(s))) {
+          if (SENSITIVE_KEY_PATTERN.test(key.toLowerCase())) {
             result[key] = '[REDACTED]';
           } else {
             result[key] = sanitize(value);
@@ -4,7 +4,8 @@ import { SelfStateStore } from './self_state_store';
 export class SelfModel {
   private state: SelfModelState;
   private store: SelfStateStore;
-  private lastPersistedState?: SelfModelState; // Object snapshot for delta comparison
+  // Snapshot of the fields compared in the persistence delta check
+  private lastPersistedState?: Pick<SelfModelState, 'confidence' | 'risk_tension' | 'autonomy_level'>;
 
   // Thresholds for heuristics
   private readonly FATIGUE_THRESHOLD = 0.75;
@@ -137,8 +138,12 @@ export class SelfModel {
 
     if (shouldPersist) {
         await this.store.save(this.state);
-        // Deep copy state for next comparison
-        this.lastPersistedState = JSON.parse(JSON.stringify(this.state));
+        // Keep only the compared scalars; no need to deep copy the whole state
+        this.lastPersistedState = {
+          confidence: this.state.confidence,
+          risk_tension: this.state.risk_tension,
+          autonomy_level: this.state.autonomy_level,
+        };
         return true;
     }
 